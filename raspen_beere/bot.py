@@ -1,38 +1,87 @@
 import asyncio
 import base64
 import io
-import json
 import logging
 import os
-from datetime import datetime
+import sqlite3
+import threading
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine
+from datetime import date
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
-import matplotlib.pyplot as plt
-from filelock import FileLock
-from matplotlib.dates import DateFormatter
+import orjson
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import Application, CallbackQueryHandler, CommandHandler, ContextTypes
 
-from raspen_beere.dht22 import DHT22
 from raspen_beere.file import get_sensor_file
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+    from matplotlib.lines import Line2D
+
 # Set logging level for external libraries
 logging.getLogger("httpx").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between outgoing messages, overall and to the same chat
+GLOBAL_SEND_INTERVAL = 1 / 30
+CHAT_SEND_INTERVAL = 1.0
+# Seconds to keep sending queued messages when the bot stops
+OUTBOX_DRAIN_TIMEOUT = 10.0
+# Roles stored in the users table
+WHITELIST = "whitelist"
+BLACKLIST = "blacklist"
+# Number of log entries shown per /history message
+HISTORY_PAGE_SIZE = 20
+
+HandlerCallback = Callable[
+    [Update, ContextTypes.DEFAULT_TYPE], Coroutine[Any, Any, None]
+]
+
 
 class TelegramBot:
     def __init__(self) -> None:
         data_dir = Path.cwd() / "data"
         data_dir.mkdir(exist_ok=True)
-        self.dht22 = DHT22()
-        self.whitelist_file = data_dir / "whitelist.json"
-        self.blacklist_file = data_dir / "blacklist.json"
         self.admin_id = int(os.environ["TELEGRAM_ADMIN"])
-        self.whitelist = self.load_json_users(self.whitelist_file)
-        self.blacklist = self.load_json_users(self.blacklist_file)
+        self.db = sqlite3.connect(data_dir / "users.db", check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS users ("
+            "id INTEGER PRIMARY KEY, role TEXT NOT NULL, info TEXT NOT NULL)"
+        )
+        # Import the blacklist first so an id listed in both files stays denied
+        self.migrate_json_users(data_dir / "blacklist.json", BLACKLIST)
+        self.migrate_json_users(data_dir / "whitelist.json", WHITELIST)
+        # Integer ids for the per-update authentication check
+        self._whitelist_ids: set[int] = set()
+        self._blacklist_ids: set[int] = set()
+        for user_id, role in self.db.execute("SELECT id, role FROM users"):
+            if role == WHITELIST:
+                self._whitelist_ids.add(user_id)
+            elif role == BLACKLIST:
+                self._blacklist_ids.add(user_id)
         self.pending_requests: dict[int, dict[str, Any]] = {}
+        # Outgoing messages per chat, drained by _sender_worker
+        self._outbox: dict[int, deque[Callable[[], Awaitable[Any]]]] = {}
+        self._outbox_event = asyncio.Event()
+        self._outbox_closed = False
+        self._measurement_cache: (
+            tuple[tuple[Path, int, int], list[dict[str, Any]]] | None
+        ) = None
+        self._graph_cache: tuple[tuple[Path, int, int], bytes] | None = None
+        # Figure is built on the first /graph and reused for every later render
+        self._figure: tuple[Figure, Axes, Axes, Line2D, Line2D] | None = None
+        self._png_buffer = io.BytesIO()
+        self._render_lock = threading.Lock()
+        # Updates are handled concurrently, but in order within each chat. Each lock
+        # is kept with the number of handlers using it and removed once unused.
+        self._chat_locks: dict[int, tuple[asyncio.Lock, int]] = {}
         self.lock = (
             asyncio.Lock()
         )  # Ensures safe modifications across concurrent requests
@@ -41,53 +90,116 @@ class TelegramBot:
         if not file_path.is_file():
             return {}
 
-        with file_path.open("r") as f:
-            data: dict[str, dict[str, Any]] = json.load(f)
+        with file_path.open("rb") as f:
+            data: dict[str, dict[str, Any]] = orjson.loads(f.read())
         return data
 
-    def save_json_users(self, file_path: Path, data: dict[str, dict[str, Any]]) -> None:
-        with file_path.open("w") as f:
-            json.dump(data, f, indent=2)
-
-    def get_last_measurement(self) -> list[dict[str, Any]] | None:
-        json_file, lock_file = get_sensor_file()
-        with FileLock(str(lock_file)):
-            if json_file.is_file():
-                with json_file.open("r") as f:
-                    try:
-                        data = json.load(f)
-                        return data if data else None
-                    except json.JSONDecodeError:
-                        return None
-        return None
+    def migrate_json_users(self, file_path: Path, role: str) -> None:
+        # Import a user list from the old JSON storage once, then keep a backup
+        if not file_path.is_file():
+            return
+
+        users = self.load_json_users(file_path)
+        with self.db:
+            self.db.executemany(
+                "INSERT OR IGNORE INTO users (id, role, info) VALUES (?, ?, ?)",
+                [
+                    (int(user_id), role, orjson.dumps(info).decode())
+                    for user_id, info in users.items()
+                ],
+            )
+        file_path.rename(file_path.with_name(f"{file_path.name}.bak"))
+        logger.info(f"Migrated {len(users)} users from {file_path} to the database")
+
+    def save_user(self, user_id: int, role: str, info: dict[str, Any]) -> None:
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO users (id, role, info) VALUES (?, ?, ?)",
+                (user_id, role, orjson.dumps(info).decode()),
+            )
+
+    def get_measurements(self) -> list[dict[str, Any]] | None:
+        json_file = get_sensor_file()
+        key = self._cache_key(json_file)
+        if key is None:
+            return None
+        # The file only changes every few minutes, reuse the parsed data until then
+        if self._measurement_cache is not None and self._measurement_cache[0] == key:
+            return self._measurement_cache[1] or None
+
+        data: list[dict[str, Any]] = []
+        with json_file.open("rb") as f:
+            for line in f:
+                try:
+                    data.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    continue
+        self._measurement_cache = (key, data)
+        return data if data else None
+
+    def get_last_measurement(self) -> dict[str, Any] | None:
+        json_file = get_sensor_file()
+        key = self._cache_key(json_file)
+        if key is None:
+            return None
+        if self._measurement_cache is not None and self._measurement_cache[0] == key:
+            data = self._measurement_cache[1]
+            return data[-1] if data else None
+
+        with json_file.open("rb") as f:
+            line = self._read_last_line(f)
+        try:
+            return orjson.loads(line) if line else None
+        except orjson.JSONDecodeError:
+            return None
+
+    @staticmethod
+    def _cache_key(file_path: Path) -> tuple[Path, int, int] | None:
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return None
+        return file_path, stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _read_last_line(f: BinaryIO, chunk_size: int = 256) -> bytes:
+        # Scan backwards from the end of the file for the last complete line,
+        # a record that is still being appended has no trailing newline yet
+        pos = f.seek(0, os.SEEK_END)
+        tail = b""
+        while pos > 0:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            tail = f.read(step) + tail
+            end = tail.rfind(b"\n")
+            if end == -1:
+                continue
+            start = tail.rfind(b"\n", 0, end)
+            if start != -1 or pos == 0:
+                return tail[start + 1 : end].strip()
+        return b""
 
     async def check_authentication(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> bool:
         user = update.effective_user
 
+        # The admin sends most of the updates, check them first
+        if user.id == self.admin_id:
+            return True
+
         # Check if the user is blacklisted
-        if str(user.id) in self.blacklist:
+        if user.id in self._blacklist_ids:
             await update.message.reply_html(
                 "🚫 Your access has been permanently denied."
             )
             return False
 
-        # Check if the user is already whitelisted (or if they are the admin)
-        if user.id == self.admin_id or str(user.id) in self.whitelist:
+        # Check if the user is already whitelisted
+        if user.id in self._whitelist_ids:
             return True
 
-        async with self.lock:
-            if user.id in self.pending_requests:
-                await update.message.reply_html(
-                    "⚠️ Your access request is already pending."
-                )
-                return False
-
-        await update.message.reply_html(
-            "⚠️ You are not authenticated. Please wait while your request is reviewed."
-        )
-
         user_info = {
             "id": user.id,
             "first_name": user.first_name or "Unknown",
@@ -95,9 +207,19 @@ class TelegramBot:
             "username": f"@{user.username}" if user.username else "Unknown",
             "language": user.language_code or "Unknown",
         }
-        # Safely store the pending request
+        # Check and store the pending request in one critical section
         async with self.lock:
-            self.pending_requests[user.id] = user_info
+            already_pending = user.id in self.pending_requests
+            if not already_pending:
+                self.pending_requests[user.id] = user_info
+
+        if already_pending:
+            await update.message.reply_html("⚠️ Your access request is already pending.")
+            return False
+
+        await update.message.reply_html(
+            "⚠️ You are not authenticated. Please wait while your request is reviewed."
+        )
 
         message = (
             "*Access Request*\n"
@@ -116,11 +238,15 @@ class TelegramBot:
             ]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
-        await self.app.bot.send_message(
-            chat_id=self.admin_id,
-            text=message,
-            parse_mode="Markdown",
-            reply_markup=reply_markup,
+        self._enqueue(
+            self.admin_id,
+            partial(
+                self.app.bot.send_message,
+                chat_id=self.admin_id,
+                text=message,
+                parse_mode="Markdown",
+                reply_markup=reply_markup,
+            ),
         )
         return False
 
@@ -139,9 +265,8 @@ class TelegramBot:
         if not await self.check_authentication(update, context):
             return
 
-        data = self.get_last_measurement()
-        if data:
-            last_measurement = data[-1]
+        last_measurement = self.get_last_measurement()
+        if last_measurement:
             message = (
                 "<b>Sensor Info</b>\n"
                 f"Temperatur: {last_measurement['temperature']}°C\n"
@@ -155,42 +280,96 @@ class TelegramBot:
         if not await self.check_authentication(update, context):
             return
 
-        data = self.get_last_measurement()
-        if data:
-            times = [datetime.strptime(d["timestamp"], "%H:%M") for d in data]
-            temps = [d["temperature"] for d in data]
-            humidities = [d["humidity"] for d in data]
-
-            # Create a plot with two y-axes (temperature and humidity)
-            fig, ax1 = plt.subplots()
-
-            # Plot temperature on primary y-axis
-            ax1.plot(times, temps, "b-", label="Temperature")
-            ax1.set_xlabel("Time")
-            ax1.set_ylabel("Temperature (°C)", color="b")
-            ax1.tick_params(axis="y", labelcolor="b")
-            ax1.legend(loc="upper left")
-
-            # Plot humidity on secondary y-axis
-            ax2 = ax1.twinx()
-            ax2.plot(times, humidities, "r-", label="Humidity")
-            ax2.set_ylabel("Humidity (%)", color="r")
-            ax2.tick_params(axis="y", labelcolor="r")
-            ax2.legend(loc="upper right")
-
-            ax1.xaxis.set_major_formatter(DateFormatter("%H:%M"))
-            fig.autofmt_xdate()
+        json_file = get_sensor_file()
+        key = self._cache_key(json_file)
+        # Reuse the last rendered plot as long as the sensor file is unchanged
+        if key is not None and self._graph_cache is not None:
+            cached_key, cached_png = self._graph_cache
+            if cached_key == key:
+                await update.message.reply_photo(
+                    io.BytesIO(cached_png), "Todays sensor data"
+                )
+                return
 
-            # Save the plot to a BytesIO buffer
-            buf = io.BytesIO()
-            plt.savefig(buf, format="png")
-            buf.seek(0)
-            plt.close(fig)
-            await update.message.reply_photo(buf, "Todays sensor data")
+        data = self.get_measurements()
+        if data:
+            # Rendering takes a while, keep other chats responsive meanwhile
+            png = await asyncio.to_thread(self._render_graph, data)
+            if key is not None:
+                self._graph_cache = (key, png)
+            await update.message.reply_photo(io.BytesIO(png), "Todays sensor data")
         else:
             message = "⚠️ Noch keine Messdaten verfügbar."
             await update.message.reply_html(message)
 
+    def _render_graph(self, data: list[dict[str, Any]]) -> bytes:
+        # numpy is only needed for /graph, import it on first use
+        import numpy as np
+
+        n = len(data)
+        timestamps = np.empty(n, dtype="U5")
+        temps = np.empty(n, dtype=np.float32)
+        humidities = np.empty(n, dtype=np.float32)
+        for i, d in enumerate(data):
+            timestamps[i] = d["timestamp"]
+            temps[i] = d["temperature"]
+            humidities[i] = d["humidity"]
+        # Parse all "HH:MM" timestamps at once instead of strptime per row
+        times = np.char.add(f"{date.today().isoformat()}T", timestamps).astype(
+            "datetime64[m]"
+        )
+
+        # The figure and buffer are shared, render one graph at a time
+        with self._render_lock:
+            if self._figure is None:
+                self._figure = self._create_figure()
+            fig, ax1, ax2, temp_line, humidity_line = self._figure
+
+            temp_line.set_data(times, temps)
+            humidity_line.set_data(times, humidities)
+            for ax in (ax1, ax2):
+                ax.relim()
+                ax.autoscale_view()
+            fig.autofmt_xdate()
+
+            # Overwrite the previous PNG so the buffer stops growing after a few renders
+            buf = self._png_buffer
+            buf.seek(0)
+            fig.savefig(buf, format="png")
+            size = buf.tell()
+            with buf.getbuffer() as view:
+                return bytes(view[:size])
+
+    @staticmethod
+    def _create_figure() -> tuple["Figure", "Axes", "Axes", "Line2D", "Line2D"]:
+        import matplotlib
+
+        # Headless backend, the bot only ever renders to PNG
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        from matplotlib.dates import DateFormatter
+
+        # Create a plot with two y-axes (temperature and humidity)
+        fig, ax1 = plt.subplots()
+        ax1.xaxis_date()
+
+        # Plot temperature on primary y-axis
+        (temp_line,) = ax1.plot([], [], "b-", label="Temperature")
+        ax1.set_xlabel("Time")
+        ax1.set_ylabel("Temperature (°C)", color="b")
+        ax1.tick_params(axis="y", labelcolor="b")
+        ax1.legend(loc="upper left")
+
+        # Plot humidity on secondary y-axis
+        ax2 = ax1.twinx()
+        (humidity_line,) = ax2.plot([], [], "r-", label="Humidity")
+        ax2.set_ylabel("Humidity (%)", color="r")
+        ax2.tick_params(axis="y", labelcolor="r")
+        ax2.legend(loc="upper right")
+
+        ax1.xaxis.set_major_formatter(DateFormatter("%H:%M"))
+        return fig, ax1, ax2, temp_line, humidity_line
+
     async def pihole(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         if update.effective_user.id != self.admin_id:
             return
@@ -205,18 +384,44 @@ class TelegramBot:
         if update.effective_user.id != self.admin_id:
             return
 
-        with open("/var/log/pihole/pihole.log", "r", encoding="utf-8") as f:
-            logs = f.readlines()
-        filter = base64.b64decode("cG9ybg==").decode("utf-8")
-        logs = [i for i in logs if filter in i.lower()]
+        message, reply_markup = await self._history_page(0)
+        await update.message.reply_markdown(message, reply_markup=reply_markup)
+
+    async def _history_page(
+        self, offset: int
+    ) -> tuple[str, InlineKeyboardMarkup | None]:
+        # The log can be large, scan it without blocking the event loop
+        count, logs = await asyncio.to_thread(self._scan_log, offset)
         result = ""
         for i in logs:
-            if filter in i.lower():
-                idx = i.index(":")
-                a, _, c = i[:15], i[16:idx], i[idx + 1 : -1]
-                result += f"{a}: {c.replace('\n', '')}\n"
-        message = f"Found {len(logs)} entries:\n{result}"
-        await update.message.reply_markdown(message)
+            idx = i.index(":")
+            a, _, c = i[:15], i[16:idx], i[idx + 1 :]
+            result += f"{a}: {c}\n"
+        shown = f" ({offset + 1}-{offset + len(logs)})" if logs else ""
+        message = f"Found {count} entries{shown}:\n{result}"
+
+        # Telegram limits messages to 4096 characters, page through the rest
+        next_offset = offset + len(logs)
+        if next_offset >= count:
+            return message, None
+        keyboard = [[InlineKeyboardButton("➡️", callback_data=f"history:{next_offset}")]]
+        return message, InlineKeyboardMarkup(keyboard)
+
+    @staticmethod
+    def _scan_log(
+        offset: int = 0, limit: int = HISTORY_PAGE_SIZE
+    ) -> tuple[int, list[str]]:
+        filter = base64.b64decode("cG9ybg==")
+        count = 0
+        logs: list[str] = []
+        # Stream the file and only keep the requested page of matches in memory
+        with open("/var/log/pihole/pihole.log", "rb") as f:
+            for line in f:
+                if filter in line.lower():
+                    if offset <= count < offset + limit:
+                        logs.append(line.decode("utf-8").rstrip("\n"))
+                    count += 1
+        return count, logs
 
     async def button(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         query = update.callback_query
@@ -233,6 +438,13 @@ class TelegramBot:
             logger.error("Invalid callback data format")
             return
 
+        if decision == "history":
+            message, reply_markup = await self._history_page(offset=target_id)
+            await query.edit_message_text(
+                text=message, parse_mode="Markdown", reply_markup=reply_markup
+            )
+            return
+
         async with self.lock:
             user_info = self.pending_requests.pop(target_id, None)
 
@@ -242,38 +454,134 @@ class TelegramBot:
 
         if decision == "access_yes":
             async with self.lock:
-                self.whitelist[str(target_id)] = user_info
-                self.save_json_users(self.whitelist_file, self.whitelist)
+                self._whitelist_ids.add(target_id)
+                self.save_user(target_id, WHITELIST, user_info)
             await query.edit_message_text(text="✅ Access granted.")
-            try:
-                await context.bot.send_message(
+            self._enqueue(
+                target_id,
+                partial(
+                    context.bot.send_message,
                     chat_id=target_id,
                     text="✅ Your access request has been approved.",
-                )
-            except Exception as e:
-                logger.error(f"Failed to send message to user {target_id}: {e}")
+                ),
+            )
 
         elif decision == "access_no":
             async with self.lock:
-                self.blacklist[str(target_id)] = user_info
-                self.save_json_users(self.blacklist_file, self.blacklist)
+                self._blacklist_ids.add(target_id)
+                self.save_user(target_id, BLACKLIST, user_info)
             await query.edit_message_text(text="🚫 Access denied.")
+            self._enqueue(
+                target_id,
+                partial(
+                    context.bot.send_message,
+                    chat_id=target_id,
+                    text="🚫 Your access request has been denied.",
+                ),
+            )
+
+    def _enqueue(self, chat_id: int, send: Callable[[], Awaitable[Any]]) -> None:
+        self._outbox.setdefault(chat_id, deque()).append(send)
+        self._outbox_event.set()
+
+    async def _sender_worker(self) -> None:
+        # Stay below Telegram's limits of 30 messages/s and 1 message/s per chat.
+        # Every chat has its own queue, and whichever chat is ready first is served,
+        # so a busy chat never holds back messages to the others.
+        loop = asyncio.get_running_loop()
+        next_send = 0.0
+        next_send_per_chat: dict[int, float] = {}
+        while True:
+            if not self._outbox:
+                if self._outbox_closed:
+                    return
+                self._outbox_event.clear()
+                await self._outbox_event.wait()
+                continue
+
+            chat_id = min(
+                self._outbox, key=lambda chat: next_send_per_chat.get(chat, 0.0)
+            )
+            delay = max(next_send, next_send_per_chat.get(chat_id, 0.0)) - loop.time()
+            if delay > 0:
+                # Wake up early if a message for another chat comes in meanwhile
+                self._outbox_event.clear()
+                try:
+                    await asyncio.wait_for(self._outbox_event.wait(), delay)
+                except TimeoutError:
+                    pass
+                continue
+
+            queue = self._outbox[chat_id]
+            send = queue.popleft()
+            if not queue:
+                del self._outbox[chat_id]
             try:
-                await context.bot.send_message(
-                    chat_id=target_id, text="🚫 Your access request has been denied."
-                )
+                await send()
             except Exception as e:
-                logger.error(f"Failed to send message to user {target_id}: {e}")
+                logger.error(f"Failed to send message to chat {chat_id}: {e}")
+            now = loop.time()
+            next_send = now + GLOBAL_SEND_INTERVAL
+            next_send_per_chat[chat_id] = now + CHAT_SEND_INTERVAL
+            # Forget chats whose interval has passed
+            next_send_per_chat = {
+                chat: ready for chat, ready in next_send_per_chat.items() if ready > now
+            }
+
+    async def _post_init(self, _: object) -> None:
+        self._sender_task = asyncio.create_task(self._sender_worker())
+
+    async def _post_stop(self, _: object) -> None:
+        # Send what is still queued while the bot can still reach Telegram
+        self._outbox_closed = True
+        self._outbox_event.set()
+        try:
+            await asyncio.wait_for(self._sender_task, OUTBOX_DRAIN_TIMEOUT)
+        except TimeoutError:
+            dropped = sum(len(queue) for queue in self._outbox.values())
+            logger.warning(f"Dropped {dropped} queued messages on shutdown")
+
+    async def _post_shutdown(self, _: object) -> None:
+        self.db.close()
+
+    def _per_chat(self, callback: HandlerCallback) -> HandlerCallback:
+        async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+            chat = update.effective_chat
+            if chat is None:
+                await callback(update, context)
+                return
+            entry = self._chat_locks.get(chat.id)
+            lock, users = entry if entry is not None else (asyncio.Lock(), 0)
+            self._chat_locks[chat.id] = (lock, users + 1)
+            try:
+                async with lock:
+                    await callback(update, context)
+            finally:
+                lock, users = self._chat_locks[chat.id]
+                if users > 1:
+                    self._chat_locks[chat.id] = (lock, users - 1)
+                else:
+                    del self._chat_locks[chat.id]
+
+        return wrapper
 
     def run(self) -> None:
-        self.app = Application.builder().token(os.environ["TELEGRAM_TOKEN"]).build()
-        self.app.add_handler(CommandHandler("start", self.start))
-        self.app.add_handler(CommandHandler("help", self.start))
-        self.app.add_handler(CommandHandler("sensor", self.sensor))
-        self.app.add_handler(CommandHandler("graph", self.graph))
-        self.app.add_handler(CommandHandler("pihole", self.pihole))
-        self.app.add_handler(CommandHandler("history", self.history))
-        self.app.add_handler(CallbackQueryHandler(self.button))
+        self.app = (
+            Application.builder()
+            .token(os.environ["TELEGRAM_TOKEN"])
+            .concurrent_updates(True)
+            .post_init(self._post_init)
+            .post_stop(self._post_stop)
+            .post_shutdown(self._post_shutdown)
+            .build()
+        )
+        self.app.add_handler(CommandHandler("start", self._per_chat(self.start)))
+        self.app.add_handler(CommandHandler("help", self._per_chat(self.start)))
+        self.app.add_handler(CommandHandler("sensor", self._per_chat(self.sensor)))
+        self.app.add_handler(CommandHandler("graph", self._per_chat(self.graph)))
+        self.app.add_handler(CommandHandler("pihole", self._per_chat(self.pihole)))
+        self.app.add_handler(CommandHandler("history", self._per_chat(self.history)))
+        self.app.add_handler(CallbackQueryHandler(self._per_chat(self.button)))
         # self.app.add_error_handler(self.error_handler)
         self.app.run_polling(allowed_updates=Update.ALL_TYPES)
 
@@ -9,13 +9,10 @@ class DHT22:
     def __init__(self) -> None:
         self.dht_device = adafruit_dht.DHT22(board.D4)
 
-    def get_temperature(self) -> float:
-        return self._try_get(self._get_temperature)
+    def read(self) -> tuple[float, float]:
+        return self._try_get(self._read)
 
-    def get_humidity(self) -> float:
-        return self._try_get(self._get_humidity)
-
-    def _try_get(self, func: Callable[[], float]) -> float:
+    def _try_get(self, func: Callable[[], tuple[float, float]]) -> tuple[float, float]:
         for _ in range(15):
             try:
                 value = func()
@@ -25,10 +22,8 @@ class DHT22:
                 continue
         raise TimeoutError("There is a problem with the DHT22 Sensor.")
 
-    def _get_temperature(self) -> float:
+    def _read(self) -> tuple[float, float]:
+        # Both values come from the same measurement, the second access is cached
         temperature = self.dht_device.temperature
-        return float(temperature)
-
-    def _get_humidity(self) -> float:
         humidity = self.dht_device.humidity
-        return float(humidity)
+        return float(temperature), float(humidity)
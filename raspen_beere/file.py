@@ -1,14 +1,33 @@
-from datetime import datetime
+import os
+from datetime import date
 from pathlib import Path
 
+import orjson
+
 SENSOR_DIR = Path.cwd() / "data" / "sensor"
 SENSOR_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def get_sensor_file(now: datetime | None = None) -> tuple[Path, Path]:
-    if now is None:
-        now = datetime.now()
-    file_name = now.strftime("%Y-%m-%d")
-    json_file = SENSOR_DIR / f"{file_name}.json"
-    lock_file = SENSOR_DIR / f"{file_name}.lock"
-    return json_file, lock_file
+def get_sensor_file(day: date | None = None) -> Path:
+    if day is None:
+        day = date.today()
+    file_name = day.strftime("%Y-%m-%d")
+    return SENSOR_DIR / f"{file_name}.jsonl"
+
+
+def convert_legacy_sensor_file(day: date | None = None) -> None:
+    # Older versions stored a day as one JSON list, move those records into the JSONL
+    # file so the day's history is not lost after an update
+    json_file = get_sensor_file(day)
+    legacy_file = json_file.with_suffix(".json")
+    if not legacy_file.is_file():
+        return
+
+    records = orjson.loads(legacy_file.read_bytes())
+    data = b"".join(orjson.dumps(record) + b"\n" for record in records)
+    if json_file.is_file():
+        data += json_file.read_bytes()
+    tmp_file = json_file.with_name(f"{json_file.name}.tmp")
+    tmp_file.write_bytes(data)
+    os.replace(tmp_file, json_file)
+    legacy_file.rename(legacy_file.with_name(f"{legacy_file.name}.bak"))
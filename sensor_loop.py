@@ -1,42 +1,67 @@
-import json
+import atexit
+import signal
+import sys
 import time
-from datetime import datetime
+from collections import deque
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
 
-from filelock import FileLock
+import orjson
 
 from raspen_beere.dht22 import DHT22
-from raspen_beere.file import get_sensor_file
+from raspen_beere.file import convert_legacy_sensor_file, get_sensor_file
 
 SENSOR = DHT22()
+# Measurements that are not written to disk yet, as (file, JSONL line)
+PENDING: deque[tuple[Path, bytes]] = deque()
 
 
 def read_sensor() -> tuple[float, float]:
-    temperature = SENSOR.get_temperature()
-    humidity = SENSOR.get_humidity()
-    return temperature, humidity
+    return SENSOR.read()
 
 
-def save_data(now: datetime, temperature: float, humidity: float) -> None:
-    timestamp_time = now.strftime("%H:%M")
-    json_file, lock_file = get_sensor_file(now)
-
-    with FileLock(str(lock_file)):
-        if json_file.is_file():
-            with json_file.open("r") as f:
-                data = json.load(f)
-        else:
-            data = []
+@lru_cache(maxsize=1)
+def sensor_file(day: date) -> Path:
+    # Only changes once a day, no need to format the file name every tick
+    return get_sensor_file(day)
 
-        data.append(
-            {
-                "timestamp": timestamp_time,
-                "temperature": temperature,
-                "humidity": humidity,
-            }
-        )
 
-        with json_file.open("w") as f:
-            json.dump(data, f, indent=2)
+def save_data(now: datetime, temperature: float, humidity: float) -> None:
+    timestamp_time = f"{now.hour:02d}:{now.minute:02d}"
+    json_file = sensor_file(now.date())
+
+    entry = {
+        "timestamp": timestamp_time,
+        "temperature": temperature,
+        "humidity": humidity,
+    }
+
+    PENDING.append((json_file, orjson.dumps(entry) + b"\n"))
+
+
+def flush_data() -> None:
+    # Hold back SIGTERM so the exit handler cannot interrupt a flush halfway
+    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGTERM})
+    try:
+        while PENDING:
+            json_file = PENDING[0][0]
+            lines = []
+            for file, line in PENDING:
+                if file != json_file:
+                    break
+                lines.append(line)
+
+            # Append all buffered lines with one write instead of rewriting the
+            # whole day. The bot is the only other user of the file and only reads
+            # it, a short append needs no lock.
+            with json_file.open("ab") as f:
+                f.write(b"".join(lines))
+            # Only forget samples once they are on disk, a failed write keeps them
+            for _ in lines:
+                PENDING.popleft()
+    finally:
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGTERM})
 
 
 def sleep_duration(period_minutes: int = 0, period_seconds: int = 10) -> float:
@@ -69,12 +94,32 @@ def sleep_duration(period_minutes: int = 0, period_seconds: int = 10) -> float:
     return sleep_time
 
 
-def main() -> None:
+def main(period_minutes: int = 10, flush_every: int = 1) -> None:
+    # Write buffered measurements on exit, SIGTERM is turned into a normal exit
+    atexit.register(flush_data)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    # This process is the only writer, so it is safe to rewrite today's file here
+    convert_legacy_sensor_file()
+
+    period = period_minutes * 60
+    # Align the first tick with the wall clock, then step on the monotonic clock
+    # so NTP adjustments do not shift the cadence
+    anchor = time.monotonic() + sleep_duration(period_minutes, 0)
+    n = 0
     while True:
-        time.sleep(sleep_duration(10, 0))
+        delay = anchor + n * period - time.monotonic()
+        if delay < -period:
+            # Fell behind by more than a period, re-align with the wall clock
+            anchor = time.monotonic() + sleep_duration(period_minutes, 0)
+            n = 0
+            continue
+        time.sleep(max(0.0, delay))
+        n += 1
         now = datetime.now()
         temperature, humidity = read_sensor()
         save_data(now, temperature, humidity)
+        if len(PENDING) >= flush_every:
+            flush_data()
 
 
 if __name__ == "__main__":